@@ -12,7 +12,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN, UPDATE_INTERVAL
-from .device import HexagonLightDevice
+from .tg609 import HexagonLightConnectionError, HexagonLightDevice
 from .models import HexagonLightConfigEntry, HexagonLightData
 
 PLATFORMS: list[Platform] = [Platform.LIGHT]
@@ -56,6 +56,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: HexagonLightConfigEntry)
         """Update device state."""
         try:
             await device.async_update()
+        except HexagonLightConnectionError as ex:
+            # Out of range or backing off: keep the entity available so commands still
+            # update the desired state, which is applied once the lamp is reachable.
+            _LOGGER.debug("%s: skipping update: %s", address, ex)
         except Exception as ex:
             raise UpdateFailed(str(ex)) from ex
 
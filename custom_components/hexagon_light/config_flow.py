@@ -15,8 +15,8 @@ from homeassistant.components.bluetooth import (
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_ADDRESS
 
-from .const import DOMAIN, LOCAL_NAMES
-from .device import HexagonLightDevice
+from .const import DOMAIN
+from .tg609 import LOCAL_NAMES, HexagonLightDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -6,12 +6,4 @@ from datetime import timedelta
 
 DOMAIN = "hexagon_light"
 
-LOCAL_NAMES: tuple[str, ...] = ("Hexagon Light",)
-
-SERVICE_UUID = "0000fff0-0000-1000-8000-00805f9b34fb"
-WRITE_UUID = "0000fff3-0000-1000-8000-00805f9b34fb"
-NOTIFY_UUID = "0000fff4-0000-1000-8000-00805f9b34fb"
-
-DEVICE_TIMEOUT = 15
-STATUS_TIMEOUT = 6
 UPDATE_INTERVAL = timedelta(seconds=60)
@@ -0,0 +1,21 @@
+"""Diagnostics support for Hexagon Light."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .models import HexagonLightConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: HexagonLightConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = entry.runtime_data
+    return {
+        "title": data.title,
+        "last_update_success": data.coordinator.last_update_success,
+        "device": data.device.diagnostics(),
+    }
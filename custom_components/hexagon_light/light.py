@@ -21,7 +21,7 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .device import SCENES_TG609, HexagonLightDevice
+from .tg609 import SCENES_TG609, HexagonLightDevice
 from .models import HexagonLightConfigEntry
 
 
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .device import HexagonLightDevice
+from .tg609 import HexagonLightDevice
 
 type HexagonLightConfigEntry = ConfigEntry[HexagonLightData]
 
@@ -0,0 +1,27 @@
+"""Home Assistant independent BLE core for Hexagon Light (MeRGBW/TG609).
+
+Only depends on ``bleak``; the package uses relative imports so it can also be run
+on its own, e.g. ``PYTHONPATH=custom_components/hexagon_light python -m tg609``.
+"""
+
+from __future__ import annotations
+
+from .breaker import CircuitBreaker, CircuitState
+from .channel import ChannelStats, CommandChannel, Priority
+from .codec import SCENES_TG609, HexagonLightConnectionError, HexagonLightError
+from .const import LOCAL_NAMES
+from .device import HexagonLightDevice, HexagonLightState
+
+__all__ = [
+    "LOCAL_NAMES",
+    "SCENES_TG609",
+    "ChannelStats",
+    "CircuitBreaker",
+    "CircuitState",
+    "CommandChannel",
+    "HexagonLightConnectionError",
+    "HexagonLightDevice",
+    "HexagonLightError",
+    "HexagonLightState",
+    "Priority",
+]
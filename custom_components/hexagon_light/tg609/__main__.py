@@ -0,0 +1,7 @@
+"""Run the TG609 command line tool with ``python -m tg609``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
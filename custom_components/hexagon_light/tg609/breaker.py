@@ -0,0 +1,119 @@
+"""Per-device circuit breaker for Hexagon Light connection attempts."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import logging
+from time import monotonic
+from typing import Any
+
+from .const import BACKOFF_INITIAL, BACKOFF_MAX, FAILURE_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop connecting to a lamp after repeated failures and back off exponentially.
+
+    While open, connection attempts fail immediately. When the backoff expires, or the
+    lamp advertises again, a single probe attempt is let through: success closes the
+    breaker, failure reopens it with twice the backoff.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        backoff_initial: float = BACKOFF_INITIAL,
+        backoff_max: float = BACKOFF_MAX,
+    ) -> None:
+        self.name = name
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.last_error: str | None = None
+        self._failure_threshold = failure_threshold
+        self._backoff_initial = float(backoff_initial)
+        self._backoff_max = float(backoff_max)
+        self._backoff = self._backoff_initial
+        self._retry_at: float | None = None
+        # An advertisement may shortcut the backoff once per outage, so a lamp that
+        # advertises but can't be connected to doesn't get probed on every packet.
+        self._advertisement_probe = True
+
+    def allow_request(self) -> bool:
+        """Return True if a connection attempt may be made now."""
+        if self.state is CircuitState.OPEN:
+            if self._retry_at is not None and monotonic() < self._retry_at:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            _LOGGER.debug("%s: circuit half-open, probing", self.name)
+        return True
+
+    def retry_in(self) -> float | None:
+        """Seconds until the next probe is allowed, if the breaker is open."""
+        if self.state is not CircuitState.OPEN or self._retry_at is None:
+            return None
+        return max(0.0, self._retry_at - monotonic())
+
+    def record_success(self) -> None:
+        if self.state is not CircuitState.CLOSED:
+            _LOGGER.debug("%s: circuit closed", self.name)
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._backoff = self._backoff_initial
+        self._retry_at = None
+        self._advertisement_probe = True
+
+    def record_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        self.last_error = str(error) or type(error).__name__
+        if self.state is CircuitState.HALF_OPEN:
+            self._backoff = min(self._backoff * 2, self._backoff_max)
+            self._open()
+        elif self.state is CircuitState.CLOSED and self.failures >= self._failure_threshold:
+            self.trips += 1
+            self._open()
+
+    def record_advertisement(self) -> bool:
+        """Let the next attempt through right away if the lamp is seen again.
+
+        Returns True if a connection attempt would be allowed now.
+        """
+        if self.state is not CircuitState.OPEN:
+            return True
+        if self._advertisement_probe:
+            self._advertisement_probe = False
+            self._retry_at = None
+            return True
+        return self._retry_at is None or monotonic() >= self._retry_at
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self._retry_at = monotonic() + self._backoff
+        _LOGGER.debug(
+            "%s: circuit open after %s failures, next attempt in %.0fs",
+            self.name,
+            self.failures,
+            self._backoff,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        retry_in = self.retry_in()
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "trips": self.trips,
+            "backoff": self._backoff,
+            "retry_in": None if retry_in is None else round(retry_in, 1),
+            "last_error": self.last_error,
+        }
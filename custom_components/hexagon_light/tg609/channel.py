@@ -0,0 +1,210 @@
+"""Serialized per-device command channel for Hexagon Light."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import IntEnum
+import logging
+from time import monotonic
+from typing import Any, TypeVar
+
+from .const import BACKGROUND_MAX_WAIT
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class Priority(IntEnum):
+    """Scheduling lane of a channel job; lower values run first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass
+class ChannelStats:
+    """Queue metrics of a command channel."""
+
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    preempted: int = 0
+    forced: int = 0
+    max_depth: int = 0
+    last_wait: float = 0.0
+    max_wait: float = 0.0
+    total_wait: float = 0.0
+
+    def record_wait(self, wait: float) -> None:
+        self.started += 1
+        self.last_wait = wait
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.started if self.started else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "started": self.started,
+            "completed": self.completed,
+            "failed": self.failed,
+            "preempted": self.preempted,
+            "forced": self.forced,
+            "max_depth": self.max_depth,
+            "last_wait": round(self.last_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "avg_wait": round(self.avg_wait, 3),
+        }
+
+
+@dataclass
+class _Job:
+    func: Callable[[], Awaitable[Any]]
+    future: asyncio.Future[Any]
+    enqueued: float
+    priority: Priority
+
+
+class CommandChannel:
+    """Run device jobs one at a time on a single worker.
+
+    Interactive jobs run before background ones, in submission order within a lane.
+    A background job that has waited longer than ``max_background_wait`` runs next
+    regardless, so polls are never starved by a steady stream of user commands.
+    """
+
+    def __init__(self, name: str, *, max_background_wait: float = BACKGROUND_MAX_WAIT) -> None:
+        self.name = name
+        self.stats = {priority: ChannelStats() for priority in Priority}
+        self._max_background_wait = float(max_background_wait)
+        self._queues: dict[Priority, deque[_Job]] = {priority: deque() for priority in Priority}
+        self._wakeup = asyncio.Event()
+        self._interactive_waiting = asyncio.Event()
+        self._forced = False
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for the worker."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def interactive_waiting(self) -> bool:
+        """True while an interactive job is queued behind the running one."""
+        return self._interactive_waiting.is_set()
+
+    @property
+    def current_job_forced(self) -> bool:
+        """True while a starved background job runs ahead of queued interactive jobs.
+
+        Such a job must not yield to those interactive jobs, or it would never complete.
+        """
+        return self._forced
+
+    def record_preempted(self, priority: Priority) -> None:
+        """Count a job that stopped early to let an interactive job run."""
+        self.stats[priority].preempted += 1
+
+    async def async_wait_interactive(self) -> None:
+        """Wait until an interactive job is queued; used by background jobs to yield."""
+        await self._interactive_waiting.wait()
+
+    async def submit(
+        self, func: Callable[[], Awaitable[_T]], priority: Priority = Priority.INTERACTIVE
+    ) -> _T:
+        """Queue a job and wait for its result."""
+        job = _Job(func, asyncio.get_running_loop().create_future(), monotonic(), priority)
+        queue = self._queues[priority]
+        queue.append(job)
+        stats = self.stats[priority]
+        stats.submitted += 1
+        if len(queue) > stats.max_depth:
+            stats.max_depth = len(queue)
+        if priority is Priority.INTERACTIVE:
+            self._interactive_waiting.set()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name=f"hexagon_light {self.name}")
+        return await job.future
+
+    def _next_job(self) -> _Job | None:
+        interactive = self._queues[Priority.INTERACTIVE]
+        background = self._queues[Priority.BACKGROUND]
+        self._forced = False
+        if background and not interactive:
+            return background.popleft()
+        if background and monotonic() - background[0].enqueued >= self._max_background_wait:
+            self._forced = True
+            self.stats[Priority.BACKGROUND].forced += 1
+            return background.popleft()
+        if interactive:
+            job = interactive.popleft()
+            if not interactive:
+                self._interactive_waiting.clear()
+            return job
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if job.future.done():
+                # The submitter gave up while the job was queued.
+                continue
+            stats = self.stats[job.priority]
+            wait = monotonic() - job.enqueued
+            stats.record_wait(wait)
+            if wait > 1.0:
+                _LOGGER.debug(
+                    "%s: %s job waited %.2fs in queue", self.name, job.priority.name.lower(), wait
+                )
+            try:
+                result = await job.func()
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as ex:  # noqa: BLE001
+                stats.failed += 1
+                if not job.future.done():
+                    job.future.set_exception(ex)
+            else:
+                stats.completed += 1
+                if not job.future.done():
+                    job.future.set_result(result)
+
+    async def async_stop(self) -> None:
+        """Stop the worker and cancel all queued jobs."""
+        worker = self._worker
+        self._worker = None
+        if worker is not None:
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+        for queue in self._queues.values():
+            while queue:
+                queue.popleft().future.cancel()
+        self._interactive_waiting.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "max_background_wait": self._max_background_wait,
+            **{
+                priority.name.lower(): {"depth": len(self._queues[priority])}
+                | self.stats[priority].as_dict()
+                for priority in Priority
+            },
+        }
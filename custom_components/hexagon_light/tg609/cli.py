@@ -0,0 +1,224 @@
+"""Command line tool to scan, query and configure many Hexagon Lights at once."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+import json
+import logging
+from time import monotonic
+from typing import Any
+
+from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from .channel import Priority
+from .codec import HexagonLightError, resolve_scene
+from .const import LOCAL_NAMES
+from .device import HexagonLightDevice
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_SCAN_TIMEOUT = 10.0
+
+
+@dataclass
+class Result:
+    """Outcome of one operation on one lamp."""
+
+    address: str
+    ok: bool
+    elapsed: float
+    data: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+async def discover(
+    timeout: float, addresses: Collection[str] | None = None
+) -> dict[str, tuple[BLEDevice, int | None]]:
+    """Scan for Hexagon Lights, keyed by upper-case address.
+
+    With ``addresses`` only those lamps are collected and the scan stops as soon as
+    all of them have been seen; otherwise it runs for the whole ``timeout``.
+    """
+    wanted = {address.upper() for address in addresses} if addresses else None
+    lamps: dict[str, tuple[BLEDevice, int | None]] = {}
+    all_found = asyncio.Event()
+
+    def _detected(device: BLEDevice, adv: AdvertisementData) -> None:
+        address = device.address.upper()
+        if wanted is None:
+            if not (adv.local_name or device.name or "").startswith(LOCAL_NAMES):
+                return
+        elif address not in wanted:
+            return
+        lamps[address] = (device, adv.rssi)
+        if wanted is not None and wanted <= lamps.keys():
+            all_found.set()
+
+    async with BleakScanner(detection_callback=_detected):
+        with suppress(TimeoutError):
+            await asyncio.wait_for(all_found.wait(), timeout)
+    return lamps
+
+
+async def run_many(
+    addresses: Sequence[str],
+    devices: dict[str, tuple[BLEDevice, int | None]],
+    func: Callable[[HexagonLightDevice], Awaitable[dict[str, Any]]],
+    concurrency: int,
+) -> list[Result]:
+    """Run ``func`` against every address with at most ``concurrency`` lamps in flight."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run_one(address: str) -> Result:
+        found = devices.get(address.upper())
+        if found is None:
+            return Result(address, False, 0.0, error="not found in scan")
+        async with semaphore:
+            device = HexagonLightDevice(found[0])
+            start = monotonic()
+            try:
+                data = await func(device)
+            except Exception as ex:  # noqa: BLE001
+                return Result(address, False, monotonic() - start, error=str(ex) or repr(ex))
+            finally:
+                await device.async_stop()
+            return Result(address, True, monotonic() - start, data)
+
+    return list(await asyncio.gather(*(_run_one(address) for address in addresses)))
+
+
+def _state(device: HexagonLightDevice) -> dict[str, Any]:
+    return {"is_on": device.is_on, "brightness_percent": device.brightness_percent}
+
+
+async def _status(device: HexagonLightDevice) -> dict[str, Any]:
+    if not await device.async_update(Priority.INTERACTIVE):
+        raise HexagonLightError("no status notification received")
+    return _state(device)
+
+
+def _apply_func(
+    args: argparse.Namespace,
+) -> Callable[[HexagonLightDevice], Awaitable[dict[str, Any]]]:
+    async def _apply(device: HexagonLightDevice) -> dict[str, Any]:
+        if args.power == "off":
+            await device.async_turn_off()
+        else:
+            await device.async_turn_on()
+            if args.scene is not None:
+                await device.async_set_scene_by_name(args.scene, speed=args.speed)
+            elif args.rgb is not None:
+                await device.async_set_rgb(*args.rgb)
+            if args.brightness is not None:
+                await device.async_set_brightness_percent(args.brightness)
+        await device.async_flush()
+        return _state(device)
+
+    return _apply
+
+
+def _parse_rgb(value: str) -> tuple[int, int, int]:
+    try:
+        r, g, b = (int(part) for part in value.split(","))
+    except ValueError as ex:
+        raise argparse.ArgumentTypeError(f"expected R,G,B, got {value!r}") from ex
+    return r, g, b
+
+
+def _parse_scene(value: str) -> str:
+    try:
+        return resolve_scene(value)[0]
+    except HexagonLightError as ex:
+        raise argparse.ArgumentTypeError(str(ex)) from ex
+
+
+def _print_results(results: list[Result], as_json: bool) -> None:
+    if as_json:
+        rows = [asdict(result) | {"elapsed": round(result.elapsed, 3)} for result in results]
+        print(json.dumps(rows, indent=2))
+        return
+    for result in results:
+        details = result.error if not result.ok else " ".join(
+            f"{key}={value}" for key, value in result.data.items()
+        )
+        status = "ok" if result.ok else "FAIL"
+        print(f"{result.address}\t{status}\t{result.elapsed:.2f}s\t{details}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tg609", description=__doc__)
+    parser.add_argument("-v", "--verbose", action="store_true", help="enable debug logging")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument(
+        "--scan-timeout",
+        type=float,
+        default=DEFAULT_SCAN_TIMEOUT,
+        help=(
+            "seconds to scan for lamps; status/apply stop early once every address "
+            "is seen (default: %(default)s)"
+        ),
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("scan", help="list nearby lamps")
+
+    for name, help_text in (("status", "query power and brightness"), ("apply", "set state")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("addresses", nargs="+", metavar="ADDRESS")
+        cmd.add_argument(
+            "-c",
+            "--concurrency",
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help="lamps to talk to at the same time (default: %(default)s)",
+        )
+        if name == "apply":
+            cmd.add_argument("--power", choices=("on", "off"), default="on")
+            cmd.add_argument("--brightness", type=int, metavar="PERCENT")
+            color = cmd.add_mutually_exclusive_group()
+            color.add_argument("--rgb", type=_parse_rgb, metavar="R,G,B")
+            color.add_argument("--scene", type=_parse_scene, metavar="NAME")
+            cmd.add_argument("--speed", type=int, help="scene speed, 0-255")
+    return parser
+
+
+async def async_main(args: argparse.Namespace) -> int:
+    if args.command == "scan":
+        lamps = await discover(args.scan_timeout)
+        if args.json:
+            print(
+                json.dumps(
+                    [
+                        {"address": address, "name": device.name, "rssi": rssi}
+                        for address, (device, rssi) in sorted(lamps.items())
+                    ],
+                    indent=2,
+                )
+            )
+        else:
+            for address, (device, rssi) in sorted(lamps.items()):
+                print(f"{address}\t{rssi}\t{device.name}")
+        return 0
+
+    lamps = await discover(args.scan_timeout, args.addresses)
+    func = _status if args.command == "status" else _apply_func(args)
+    results = await run_many(args.addresses, lamps, func, args.concurrency)
+    _print_results(results, args.json)
+    return 0 if all(result.ok for result in results) else 1
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    try:
+        return asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        return 130
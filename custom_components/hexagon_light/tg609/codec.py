@@ -0,0 +1,144 @@
+"""TG609 frame codec for Hexagon Light (MeRGBW)."""
+
+from __future__ import annotations
+
+import colorsys
+
+
+class HexagonLightError(RuntimeError):
+    """Raised for protocol/connection errors."""
+
+
+class HexagonLightConnectionError(HexagonLightError):
+    """Raised when the lamp can't be reached (connect failed or circuit breaker open)."""
+
+
+SCENES_TG609: dict[str, int] = {
+    "symphony": 2,
+    "energy": 3,
+    "jump": 4,
+    "vitality": 7,
+    "accumulation": 16,
+    "chase": 23,
+    "space-time": 45,
+    "space_time": 45,
+    "ephemeral": 35,
+    "flow": 55,
+    "forest": 13,
+    "neon_lights": 48,
+    "neon-lights": 48,
+    "green_jade": 71,
+    "green-jade": 71,
+    "running": 91,
+    "pink_light": 109,
+    "pink-light": 109,
+    "alarm": 113,
+    "aurora": 59,
+    "rainbow": 26,
+    "melody": 32,
+}
+
+
+def clamp_int(value: int, lo: int, hi: int) -> int:
+    if value < lo:
+        return lo
+    if value > hi:
+        return hi
+    return value
+
+
+def _checksum_ff(sum_without_checksum: int) -> int:
+    return (0xFF - (sum_without_checksum & 0xFF)) & 0xFF
+
+
+def build_command(cmd: int, payload: bytes | None) -> bytes:
+    """Build a ``0x55`` command frame with checksum."""
+    if payload is None:
+        payload = b""
+    cmd = cmd & 0xFF
+    seq = 0xFF
+    length = 5 + len(payload)
+    if length > 0xFF:
+        raise ValueError(f"Command too long: {length} bytes")
+    frame = bytearray(length)
+    frame[0] = 0x55
+    frame[1] = cmd
+    frame[2] = seq
+    frame[3] = length & 0xFF
+    frame[4 : 4 + len(payload)] = payload
+    frame[-1] = _checksum_ff(sum(frame[:-1]))
+    return bytes(frame)
+
+
+def u16_be(value: int) -> bytes:
+    value = value & 0xFFFF
+    return bytes([(value >> 8) & 0xFF, value & 0xFF])
+
+
+def rgb_to_hue_sat_payload(r: int, g: int, b: int) -> bytes:
+    r = clamp_int(r, 0, 255)
+    g = clamp_int(g, 0, 255)
+    b = clamp_int(b, 0, 255)
+    h, s, _v = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
+    hue_deg = int(h * 360.0) % 360
+    sat_1000 = clamp_int(int(s * 1000.0), 0, 1000)
+    return u16_be(hue_deg) + u16_be(sat_1000)
+
+
+def parse_status(raw: bytes | None) -> tuple[bool, int | None] | None:
+    """Decode a status frame into ``(is_on, brightness_percent)``.
+
+    Returns None for anything that is not a valid ``cmd=0x00`` status frame.
+    """
+    if not raw or len(raw) < 6:
+        return None
+    if (sum(raw) & 0xFF) != 0xFF:
+        return None
+
+    brightness_percent: int | None = None
+
+    if raw[0] == 0x55:
+        length = raw[3]
+        if length != len(raw):
+            return None
+
+        # 0x55 frames may also be responses to other commands (e.g. scene index or hue),
+        # which would corrupt HA state if parsed as power/brightness.
+        if raw[1] != 0x00:
+            return None
+
+        is_on = raw[4] != 0
+        if len(raw) >= 7:
+            b = int(raw[5]) - 5
+            if 0 <= b <= 100:
+                brightness_percent = b
+        return is_on, brightness_percent
+
+    if raw[0] != 0x56:
+        return None
+
+    # Similar to 0x55, devices may send non-status 0x56 frames (cmd != 0x00)
+    # as responses to other commands; ignore those to avoid state glitches.
+    if raw[1] != 0x00:
+        return None
+
+    is_on = raw[4] != 0
+    if len(raw) >= 8:
+        value = (raw[5] << 8) | raw[6]
+        b = (value // 10) - 5
+        if 0 <= b <= 100:
+            brightness_percent = b
+    return is_on, brightness_percent
+
+
+def resolve_scene(name: str) -> tuple[str, int]:
+    """Look up a scene by name, accepting spaces, dashes or underscores."""
+    key = name.strip().lower().replace(" ", "_")
+    scene = SCENES_TG609.get(key)
+    if scene is not None:
+        return key, scene
+    key2 = key.replace("_", "-")
+    scene = SCENES_TG609.get(key2)
+    if scene is not None:
+        return key2, scene
+    raise HexagonLightError(f"Unknown scene name: {name!r}")
@@ -0,0 +1,20 @@
+"""Constants for the TG609 protocol core."""
+
+from __future__ import annotations
+
+LOCAL_NAMES: tuple[str, ...] = ("Hexagon Light",)
+
+SERVICE_UUID = "0000fff0-0000-1000-8000-00805f9b34fb"
+WRITE_UUID = "0000fff3-0000-1000-8000-00805f9b34fb"
+NOTIFY_UUID = "0000fff4-0000-1000-8000-00805f9b34fb"
+
+DEVICE_TIMEOUT = 15
+STATUS_TIMEOUT = 6
+# Longest a background poll may be held back by user commands.
+BACKGROUND_MAX_WAIT = 30
+
+FAILURE_THRESHOLD = 3
+BACKOFF_INITIAL = 60
+BACKOFF_MAX = 1800
+# Connect timeout of the single attempt made while the circuit breaker is half-open.
+PROBE_TIMEOUT = 5
@@ -0,0 +1,477 @@
+"""BLE protocol implementation for Hexagon Light (MeRGBW/TG609)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from functools import partial
+import logging
+from time import monotonic
+from typing import Any
+
+from bleak import BleakClient
+from bleak.backends.device import BLEDevice
+
+from .breaker import CircuitBreaker, CircuitState
+from .channel import CommandChannel, Priority
+from .codec import (
+    HexagonLightConnectionError,
+    build_command,
+    clamp_int,
+    parse_status,
+    resolve_scene,
+    rgb_to_hue_sat_payload,
+    u16_be,
+)
+from .const import (
+    DEVICE_TIMEOUT,
+    NOTIFY_UUID,
+    PROBE_TIMEOUT,
+    SERVICE_UUID,
+    STATUS_TIMEOUT,
+    WRITE_UUID,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_ROOT_LOGGER = logging.getLogger(__package__)
+
+
+@dataclass
+class HexagonLightState:
+    """Lamp state as tracked by the reconciler; ``None`` means unknown / don't care."""
+
+    is_on: bool | None = None
+    brightness_percent: int | None = None
+    rgb: tuple[int, int, int] | None = None
+    scene: int | None = None
+    speed: int | None = None
+
+
+class HexagonLightDevice:
+    """Async controller for Hexagon Light."""
+
+    def __init__(self, ble_device: BLEDevice) -> None:
+        self.address = ble_device.address
+        self.name = ble_device.name or self.address
+        self._ble_device = ble_device
+
+        self._client: BleakClient | None = None
+        self._write_response: bool | None = None
+        self._connect_lock = asyncio.Lock()
+        self._breaker = CircuitBreaker(self.address)
+        self._channel = CommandChannel(self.address)
+
+        # Commands only update the target state; the reconciler writes the difference
+        # to the lamp whenever it is reachable.
+        self._target = HexagonLightState()
+        self._applied = HexagonLightState()
+        self._reconcile_task: asyncio.Task[None] | None = None
+        self._reconcile_priority = Priority.BACKGROUND
+
+        self._callbacks: set[Callable[[], None]] = set()
+        self._status_event = asyncio.Event()
+        # Frames written so far, and the count when the outstanding status request was
+        # sent; a reply that arrives after later frames were written is stale.
+        self._write_seq = 0
+        self._status_request_seq: int | None = None
+        self._last_notify: bytes | None = None
+        self._last_on_command_ts: float | None = None
+        self._last_notify_log_ts: float | None = None
+
+        self.is_on: bool | None = None
+        self.brightness_percent: int | None = None
+        self.rgb: tuple[int, int, int] | None = None
+        self.effect: str | None = None
+
+    def set_ble_device_and_advertisement_data(self, ble_device: BLEDevice, _adv: object) -> None:
+        """Update the BLEDevice reference from bluetooth callbacks."""
+        self._ble_device = ble_device
+        allowed = self._breaker.record_advertisement()
+        if allowed and self._reconcile_task is None and self._pending_frames():
+            # The lamp is advertising again: push the state requested while it was away.
+            # This isn't user traffic, so it must not preempt polls.
+            self._schedule_reconcile(Priority.BACKGROUND)
+
+    def register_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback to be called when state updates."""
+        self._callbacks.add(callback)
+
+        def _remove() -> None:
+            self._callbacks.discard(callback)
+
+        return _remove
+
+    def _call_callbacks(self) -> None:
+        for cb in list(self._callbacks):
+            with suppress(Exception):
+                cb()
+
+    def _on_disconnect(self, _client: BleakClient) -> None:
+        self._client = None
+        self._write_response = None
+        self._status_event.clear()
+        self._status_request_seq = None
+        self._forget_color()
+
+    def _forget_color(self) -> None:
+        # Status frames only report power and brightness, so once the link drops the
+        # lamp's color/scene is unknown (the remote or the app may change it). A color
+        # still waiting to be sent is kept and re-sent in full; otherwise there is no
+        # intent left to deliver and the target is cleared too, so a reconnect doesn't
+        # overwrite whatever the lamp shows now.
+        target = self._target
+        applied = self._applied
+        if target.scene is not None:
+            color_pending = target.scene != applied.scene or (
+                target.speed is not None and target.speed != applied.speed
+            )
+        else:
+            color_pending = target.rgb is not None and target.rgb != applied.rgb
+        for state in (applied,) if color_pending else (applied, target):
+            state.rgb = None
+            state.scene = None
+            state.speed = None
+
+    def _handle_notify(self, sender: object, data: bytearray) -> None:
+        raw = bytes(data)
+        self._last_notify = raw
+        now = monotonic()
+        # Log via the package logger so it shows up even if per-module logger
+        # configuration doesn't get applied as expected.
+        if _ROOT_LOGGER.isEnabledFor(logging.DEBUG):
+            last = self._last_notify_log_ts
+            if last is None or (now - last) > 0.5:
+                self._last_notify_log_ts = now
+                _ROOT_LOGGER.debug(
+                    "%s: HEXAGON_NOTIFY sender=%s data=%s",
+                    self.address,
+                    (
+                        f"0x{sender:04x}"
+                        if isinstance(sender, int)
+                        else (
+                            f"0x{sender.handle:04x}"
+                            if hasattr(sender, "handle") and isinstance(getattr(sender, "handle"), int)
+                            else str(sender)
+                        )
+                    ),
+                    raw.hex(),
+                )
+
+        if self._parse_state(raw):
+            self._status_event.set()
+            self._call_callbacks()
+
+    async def async_stop(self) -> None:
+        """Stop the command channel and disconnect the device."""
+        await self._channel.async_stop()
+        client = self._client
+        self._client = None
+        self._write_response = None
+        if client is not None:
+            with suppress(Exception):
+                await client.disconnect()
+
+    async def _ensure_connected(self) -> BleakClient:
+        client = self._client
+        if client is not None and client.is_connected:
+            return client
+
+        async with self._connect_lock:
+            client = self._client
+            if client is not None and client.is_connected:
+                return client
+            if not self._breaker.allow_request():
+                raise HexagonLightConnectionError(
+                    f"{self.address}: device unreachable, next attempt in "
+                    f"{self._breaker.retry_in() or 0:.0f}s"
+                )
+            timeout = (
+                PROBE_TIMEOUT if self._breaker.state is CircuitState.HALF_OPEN else DEVICE_TIMEOUT
+            )
+            try:
+                client = await self._connect(float(timeout))
+            except Exception as ex:
+                self._breaker.record_failure(ex)
+                raise HexagonLightConnectionError(
+                    f"{self.address}: failed to connect: {ex or type(ex).__name__}"
+                ) from ex
+            self._breaker.record_success()
+            return client
+
+    async def _connect(self, timeout: float) -> BleakClient:
+        client = BleakClient(
+            self._ble_device,
+            timeout=timeout,
+            disconnected_callback=self._on_disconnect,
+        )
+        await client.connect()
+
+        with suppress(Exception):
+            await client.start_notify(NOTIFY_UUID, self._handle_notify)
+
+        with suppress(Exception):
+            svcs = await client.get_services()
+            svc = svcs.get_service(SERVICE_UUID) if svcs else None
+            ch = svc.get_characteristic(WRITE_UUID) if svc else None
+            props = set(ch.properties or []) if ch else set()
+            self._write_response = "write-without-response" not in props
+
+        self._forget_color()
+        self._client = client
+        return client
+
+    async def _write_frame(self, frame: bytes) -> None:
+        client = await self._ensure_connected()
+
+        response = self._write_response
+        if response is None:
+            response = False
+
+        try:
+            await client.write_gatt_char(WRITE_UUID, frame, response=response)
+        except Exception:
+            if response is False:
+                await client.write_gatt_char(WRITE_UUID, frame, response=True)
+                self._write_response = True
+            else:
+                raise
+        self._write_seq += 1
+
+    def _parse_state(self, raw: bytes | None) -> bool:
+        status = parse_status(raw)
+        if status is None:
+            return False
+        request_seq = self._status_request_seq
+        self._status_request_seq = None
+        if request_seq is not None and self._write_seq > request_seq:
+            # Reply to a poll that was preempted by a user command: it describes the
+            # lamp before that command and would revert it if adopted.
+            _LOGGER.debug("%s: dropping status reply older than the last command", self.address)
+            return False
+        self._apply_status(*status)
+        return True
+
+    def _apply_status(self, is_on: bool | None, brightness_percent: int | None) -> None:
+        if (
+            is_on is False
+            and self._last_on_command_ts is not None
+            and monotonic() - self._last_on_command_ts < 30
+        ):
+            is_on = None
+
+        # While frames are still pending the status only describes what the lamp has
+        # applied so far. Once in sync it is adopted as the target too, so changes made
+        # with the remote or the app are not reverted by the next reconcile.
+        in_sync = not self._pending_frames()
+        for state in (self._applied, self._target) if in_sync else (self._applied,):
+            if is_on is not None:
+                state.is_on = is_on
+            if brightness_percent is not None:
+                state.brightness_percent = brightness_percent
+        if in_sync:
+            if is_on is not None:
+                self.is_on = is_on
+            if brightness_percent is not None:
+                self.brightness_percent = brightness_percent
+
+    def _pending_frames(self) -> list[tuple[bytes, dict[str, Any]]]:
+        """Return the frames that turn the applied state into the target state.
+
+        Each frame is paired with the fields it sets on the applied state once written.
+        """
+        target = self._target
+        applied = self._applied
+        frames: list[tuple[bytes, dict[str, Any]]] = []
+
+        if target.is_on is not None and target.is_on != applied.is_on:
+            power = bytes([0x01 if target.is_on else 0x00])
+            frames.append((build_command(0x01, power), {"is_on": target.is_on}))
+        if target.is_on is False:
+            # Color/scene/brightness changes made while off are sent once the lamp is on again.
+            return frames
+
+        if target.scene is not None:
+            scene_changed = target.scene != applied.scene
+            if scene_changed:
+                scene = u16_be(target.scene)
+                frames.append((build_command(0x06, scene), {"scene": target.scene, "rgb": None}))
+            if target.speed is not None and (scene_changed or target.speed != applied.speed):
+                speed = bytes([target.speed])
+                frames.append((build_command(0x0F, speed), {"speed": target.speed}))
+        elif target.rgb is not None and target.rgb != applied.rgb:
+            frames.append(
+                (
+                    build_command(0x03, rgb_to_hue_sat_payload(*target.rgb)),
+                    {"rgb": target.rgb, "scene": None},
+                )
+            )
+
+        if (
+            target.brightness_percent is not None
+            and target.brightness_percent != applied.brightness_percent
+        ):
+            value = (target.brightness_percent + 5) * 10
+            frames.append(
+                (
+                    build_command(0x05, u16_be(value)),
+                    {"brightness_percent": target.brightness_percent},
+                )
+            )
+        return frames
+
+    async def _write_pending(self) -> None:
+        for frame, changes in self._pending_frames():
+            await self._write_frame(frame)
+            for key, value in changes.items():
+                setattr(self._applied, key, value)
+
+    async def _reconcile(self) -> None:
+        # Frames are computed when the job starts, so target changes made while this
+        # job was queued are folded in; later changes queue a new job.
+        self._reconcile_task = None
+        await self._write_pending()
+
+    def _schedule_reconcile(self, priority: Priority = Priority.INTERACTIVE) -> asyncio.Task[None]:
+        task = self._reconcile_task
+        # A queued background reconcile doesn't hold back a user command: queue an
+        # interactive one, the background job then finds nothing left to send.
+        if task is None or priority < self._reconcile_priority:
+            task = asyncio.get_running_loop().create_task(
+                self._channel.submit(self._reconcile, priority)
+            )
+            task.add_done_callback(self._reconcile_done)
+            self._reconcile_task = task
+            self._reconcile_priority = priority
+        return task
+
+    def _reconcile_done(self, task: asyncio.Task[None]) -> None:
+        # A job that never started (cancelled while queued) still owns the slot.
+        if task is self._reconcile_task:
+            self._reconcile_task = None
+        if task.cancelled():
+            return
+        if (ex := task.exception()) is not None:
+            _LOGGER.debug(
+                "%s: failed to apply state, will retry when the device is seen: %s",
+                self.address,
+                ex,
+            )
+
+    async def async_flush(self) -> None:
+        """Apply the target state now and raise if the device cannot be reached."""
+        # The reconcile task is shared; a cancelled caller must not cancel it for others.
+        await asyncio.shield(self._schedule_reconcile())
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return connection and command channel details for diagnostics."""
+        client = self._client
+        return {
+            "address": self.address,
+            "name": self.name,
+            "connected": client is not None and client.is_connected,
+            "write_response": self._write_response,
+            "state": {
+                "is_on": self.is_on,
+                "brightness_percent": self.brightness_percent,
+                "rgb": self.rgb,
+                "effect": self.effect,
+            },
+            "target": asdict(self._target),
+            "applied": asdict(self._applied),
+            "pending_frames": [frame.hex() for frame, _ in self._pending_frames()],
+            "last_notify": self._last_notify.hex() if self._last_notify else None,
+            "channel": self._channel.as_dict(),
+            "breaker": self._breaker.as_dict(),
+        }
+
+    async def async_update(self, priority: Priority = Priority.BACKGROUND) -> bool:
+        """Apply pending state, then request a sync/status frame and update best-effort state.
+
+        Returns whether a status frame was received. Background updates stop waiting for
+        it as soon as a user command is queued; the frame is still parsed whenever it
+        arrives.
+        """
+        return await self._channel.submit(partial(self._update, priority), priority)
+
+    async def _update(self, priority: Priority) -> bool:
+        await self._write_pending()
+        self._status_event.clear()
+        await self._write_frame(build_command(0x00, None))
+        self._status_request_seq = self._write_seq
+
+        preemptible = priority is Priority.BACKGROUND and not self._channel.current_job_forced
+        waiters = {asyncio.ensure_future(self._status_event.wait())}
+        if preemptible:
+            waiters.add(asyncio.ensure_future(self._channel.async_wait_interactive()))
+        try:
+            await asyncio.wait(
+                waiters, timeout=float(STATUS_TIMEOUT), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+        if self._status_event.is_set():
+            return True
+        if preemptible and self._channel.interactive_waiting:
+            self._channel.record_preempted(priority)
+            _LOGGER.debug("%s: status poll preempted by a user command", self.address)
+            return False
+        _LOGGER.debug("%s: no status notification received", self.address)
+        return False
+
+    async def async_turn_on(self) -> None:
+        self._target.is_on = True
+        self.is_on = True
+        self._last_on_command_ts = monotonic()
+        self._schedule_reconcile()
+        self._call_callbacks()
+
+    async def async_turn_off(self) -> None:
+        self._target.is_on = False
+        self.is_on = False
+        self._last_on_command_ts = None
+        self._schedule_reconcile()
+        self._call_callbacks()
+
+    async def async_set_brightness_percent(self, percent: int) -> None:
+        percent = clamp_int(int(percent), 0, 100)
+        self._target.brightness_percent = percent
+        self.brightness_percent = percent
+        if percent > 0:
+            self._last_on_command_ts = monotonic()
+        self._schedule_reconcile()
+        self._call_callbacks()
+
+    async def async_set_rgb(self, r: int, g: int, b: int) -> None:
+        rgb = (clamp_int(int(r), 0, 255), clamp_int(int(g), 0, 255), clamp_int(int(b), 0, 255))
+        self._target.rgb = rgb
+        self._target.scene = None
+        self._target.speed = None
+        # Status frames don't report color, so the lamp may no longer show what we
+        # last wrote; an explicit command always sends its frame.
+        self._applied.rgb = None
+        self.rgb = rgb
+        self.effect = None
+        self._last_on_command_ts = monotonic()
+        self._schedule_reconcile()
+        self._call_callbacks()
+
+    async def async_set_scene(self, scene: int, *, speed: int | None = None) -> None:
+        self._target.scene = clamp_int(int(scene), 0, 0xFFFF)
+        self._target.speed = None if speed is None else clamp_int(int(speed), 0, 255)
+        self._target.rgb = None
+        self._applied.scene = None
+        self._applied.speed = None
+        self.rgb = None
+        self._last_on_command_ts = monotonic()
+        self._schedule_reconcile()
+        self._call_callbacks()
+
+    async def async_set_scene_by_name(self, name: str, *, speed: int | None = None) -> None:
+        matched_key, scene = resolve_scene(name)
+        await self.async_set_scene(scene, speed=speed)
+        self.effect = matched_key
+        self._call_callbacks()